@@ -66,5 +66,16 @@ if __name__ == "__main__":
     # Verifica argumentos de linha de comando
     if len(sys.argv) > 1 and sys.argv[1] == "--gui":
         print("Para rodar a interface gráfica, use o comando: streamlit run src/dashboard.py")
+    elif len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        # Modo serviço: importado aqui para não carregar o servidor HTTP no fluxo da CLI
+        from src.service import run_service
+        try:
+            port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+            if not 0 < port < 65536:
+                raise ValueError(port)
+        except ValueError:
+            print(f"Porta inválida: '{sys.argv[2]}'. Uso: python main.py --serve [porta]")
+            sys.exit(1)
+        run_service(port=port)
     else:
         main()
@@ -11,13 +11,16 @@ class AIAnalyzer:
     Atualmente integra com o Google Gemini para gerar análises de texto.
     """
 
-    def __init__(self):
+    def __init__(self, use_ai: bool = True):
         """
         Inicializa o analisador de IA.
         Tenta carregar a chave de API e configurar o cliente.
         Se a chave não existir, ativa o modo de fallback (sem erro crítico).
+
+        Args:
+            use_ai (bool): Se False, nunca consulta a IA e usa sempre o insight local (modo offline).
         """
-        api_key = os.getenv("GOOGLE_API_KEY")
+        api_key = os.getenv("GOOGLE_API_KEY") if use_ai else None
         self.has_key = False
         self.api_key = api_key
         
@@ -25,8 +28,8 @@ class AIAnalyzer:
             # Configura a biblioteca do Gemini com a chave fornecida
             genai.configure(api_key=api_key)
             self.has_key = True
-        else:
-            # Avisa no console que a chave não foi encontrada
+        elif use_ai:
+            # Avisa no console que a chave não foi encontrada (no modo offline o aviso é desnecessário)
             print("Aviso: GOOGLE_API_KEY não encontrada. Funcionalidades de IA usarão dados simulados.")
 
     def _generate_local_insight(self, dataframe_summary: str) -> str:
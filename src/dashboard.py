@@ -12,11 +12,19 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from data_collector import DataCollector
 from data_processor import DataProcessor
 from ai_analyzer import AIAnalyzer
+from thumbnail_cache import ThumbnailCache
 
 # Configuração da página do Streamlit
 # Define o título da aba do navegador e o layout expandido (wide)
 st.set_page_config(page_title="Analisador Automatizado de Produtos", layout="wide")
 
+@st.cache_resource
+def get_thumbnail_cache():
+    """
+    Cria uma única instância do cache de miniaturas, compartilhada entre sessões e reloads.
+    """
+    return ThumbnailCache()
+
 # Cabeçalho principal da aplicação
 st.title("📊 Analisador Automatizado de Produtos")
 st.markdown("Coleta, Processamento e Análise de Dados com Inteligência Artificial")
@@ -48,7 +56,7 @@ if 'data' in st.session_state:
     df = processor.process_and_clean()
 
     # Cria abas para organizar a visualização
-    tab1, tab2, tab3, tab4 = st.tabs(["Visão Geral", "Visualizações", "Insights de IA", "Análise Avançada"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Visão Geral", "Visualizações", "Insights de IA", "Análise Avançada", "Galeria"])
 
     with tab1:
         st.subheader("Dados Brutos")
@@ -184,6 +192,27 @@ if 'data' in st.session_state:
                 st.plotly_chart(fig_words, width="stretch")
             else:
                 st.write("Não há produtos com nota >= 4.0 para análise.")
+
+    with tab5:
+        st.subheader("Galeria de Produtos")
+
+        if 'image' in df.columns:
+            # Baixa todas as miniaturas em paralelo; as que já estão em disco são servidas direto do cache
+            with st.spinner("Carregando imagens..."):
+                thumbnails = get_thumbnail_cache().prefetch(df['image'].tolist())
+
+            # Exibe os produtos em uma grade de 5 colunas
+            cols = st.columns(5)
+            for i, row in enumerate(df.itertuples(index=False)):
+                with cols[i % 5]:
+                    thumb_path = thumbnails.get(row.image)
+                    if thumb_path:
+                        st.image(thumb_path, width="stretch")
+                    else:
+                        st.caption("Imagem indisponível")
+                    st.caption(f"{row.title} — $ {row.price:.2f}")
+        else:
+            st.warning("Dados de imagem não disponíveis para a galeria.")
 else:
     # Mensagem inicial caso nenhum dado tenha sido carregado
     st.info("Clique em 'Buscar Dados' na barra lateral para começar.")
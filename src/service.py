@@ -0,0 +1,288 @@
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from src.data_collector import DataCollector
+from src.data_processor import DataProcessor
+from src.ai_analyzer import AIAnalyzer
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Resultado de uma execução do pipeline (coleta -> processamento -> estatísticas -> IA).
+    Os produtos e estatísticas já ficam serializados para que as requisições não toquem no Pandas.
+    O snapshot nunca é alterado depois de publicado: leitores apenas consultam seus dados.
+    """
+    insight: str
+    products: Tuple[Dict[str, Any], ...]
+    category_stats: Tuple[Dict[str, Any], ...]
+    created_at: float
+
+class SnapshotService:
+    """
+    Classe responsável por executar o pipeline periodicamente em segundo plano
+    e manter em memória o snapshot mais recente.
+    O snapshot é substituído de uma só vez, então os leitores sempre veem uma versão completa.
+    """
+
+    def __init__(self, interval: int = 300, with_ai: bool = True):
+        """
+        Inicializa o serviço.
+
+        Args:
+            interval (int): Intervalo em segundos entre as atualizações do snapshot. Padrão é 300.
+            with_ai (bool): Se False, não consulta a IA a cada atualização e usa apenas o insight local.
+        """
+        self.interval = interval
+        self.with_ai = with_ai
+        self._snapshot: Optional[Snapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Criado uma única vez para não repetir o aviso de chave ausente a cada atualização
+        self._analyzer = AIAnalyzer(use_ai=with_ai)
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        """
+        Retorna o snapshot atual (ou None se o pipeline ainda não concluiu nenhuma execução).
+        """
+        return self._snapshot
+
+    def refresh(self) -> bool:
+        """
+        Executa o pipeline completo e publica um novo snapshot.
+        Em caso de falha na coleta, o snapshot anterior é mantido.
+
+        Retorna:
+            bool: True se um novo snapshot foi publicado.
+        """
+        # Evita duas atualizações simultâneas (ex: thread periódica + chamada manual)
+        with self._refresh_lock:
+            collector = DataCollector()
+            raw_data = collector.fetch_products()
+            if not raw_data:
+                print("Falha ao coletar dados. Mantendo o snapshot anterior.")
+                return False
+
+            processor = DataProcessor(raw_data)
+            df = processor.process_and_clean()
+            stats = processor.get_category_stats()
+
+            # Prepara o resumo dos dados para enviar ao modelo (mesmo formato da CLI)
+            stats_str = stats.to_string()
+            summary_for_ai = f"Total de Produtos: {len(df)}. Preço Médio: {df['price'].mean():.2f}. Estatísticas: \n{stats_str}"
+            insight = self._analyzer.generate_summary(summary_for_ai)
+
+            # to_json converte tipos do NumPy e NaN (null) para valores aceitos pelo JSON
+            products = tuple(json.loads(df.to_json(orient="records")))
+            category_stats = tuple(json.loads(stats.to_json(orient="records")))
+
+            # A atribuição de um único atributo é atômica: leitores veem o snapshot antigo ou o novo, nunca um misto
+            self._snapshot = Snapshot(
+                insight=insight,
+                products=products,
+                category_stats=category_stats,
+                created_at=time.time(),
+            )
+            print(f"Snapshot atualizado: {len(products)} produtos.")
+            return True
+
+    def _run(self, stop_event: threading.Event):
+        """
+        Laço da thread de segundo plano: atualiza o snapshot a cada intervalo até o serviço ser parado.
+        """
+        while not stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                # Uma falha inesperada não deve derrubar o serviço; o snapshot anterior continua disponível
+                print(f"Erro ao atualizar snapshot: {e}")
+            stop_event.wait(self.interval)
+
+    def start(self):
+        """
+        Inicia a thread de atualização periódica em segundo plano.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        # Cada thread recebe seu próprio evento, para que uma thread abandonada por stop() não volte a rodar
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="snapshot-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Sinaliza a thread de atualização para parar e aguarda seu término por no máximo 'timeout' segundos.
+        Se uma atualização ainda estiver em andamento, ela é abandonada (a thread é daemon e morre com o processo).
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+def _parse_price(params: Dict[str, str], name: str) -> Optional[float]:
+    """
+    Converte um parâmetro de preço para float, rejeitando valores não finitos (nan, inf).
+    """
+    if name not in params:
+        return None
+    value = float(params[name])
+    if not math.isfinite(value):
+        raise ValueError(f"{name} deve ser um número finito")
+    return value
+
+def filter_products(products: Tuple[Dict[str, Any], ...], params: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Regra de Negócio: Filtrar a lista de produtos do snapshot pelos parâmetros da requisição.
+
+    Filtros suportados:
+    1. category: categoria exata.
+    2. min_price / max_price: faixa de preço.
+    3. q: texto contido no título (sem diferenciar maiúsculas/minúsculas).
+
+    Retorna:
+        List[Dict[str, Any]]: Os produtos que atendem a todos os filtros.
+
+    Lança:
+        ValueError: Se min_price ou max_price não forem números finitos.
+    """
+    category = params.get("category")
+    min_price = _parse_price(params, "min_price")
+    max_price = _parse_price(params, "max_price")
+    query = params.get("q", "").lower()
+
+    result = []
+    for product in products:
+        if category and product.get("category") != category:
+            continue
+        price = product.get("price")
+        if min_price is not None and (price is None or price < min_price):
+            continue
+        if max_price is not None and (price is None or price > max_price):
+            continue
+        if query and query not in str(product.get("title", "")).lower():
+            continue
+        result.append(product)
+    return result
+
+def paginate(items: List[Dict[str, Any]], params: Dict[str, str], max_page_size: int = 100) -> Dict[str, Any]:
+    """
+    Recorta uma página da lista de itens a partir dos parâmetros 'page' (começando em 1) e 'page_size'.
+
+    Retorna:
+        Dict[str, Any]: Metadados da paginação e os itens da página solicitada.
+
+    Lança:
+        ValueError: Se page ou page_size não forem inteiros positivos.
+    """
+    page = int(params.get("page", 1))
+    page_size = int(params.get("page_size", 20))
+    if page < 1 or page_size < 1:
+        raise ValueError("page e page_size devem ser maiores que zero")
+    page_size = min(page_size, max_page_size)
+
+    start = (page - 1) * page_size
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total": len(items),
+        "items": items[start:start + page_size],
+    }
+
+class SnapshotRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP que responde em JSON a partir do snapshot em memória.
+    O serviço é injetado como atributo de classe por create_server().
+
+    Endpoints:
+        GET /health    -> estado do serviço e idade do snapshot.
+        GET /products  -> produtos com filtros e paginação.
+        GET /stats     -> estatísticas por categoria.
+        GET /insight   -> último insight gerado.
+    """
+    service: SnapshotService = None
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        # parse_qs retorna listas; usamos apenas o primeiro valor de cada parâmetro
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        snapshot = self.service.snapshot
+
+        if parsed.path == "/health":
+            self._send_json(200, {
+                "status": "ok" if snapshot else "starting",
+                "snapshot_age_seconds": round(time.time() - snapshot.created_at, 1) if snapshot else None,
+            })
+            return
+
+        if parsed.path not in ("/products", "/stats", "/insight"):
+            self._send_json(404, {"error": "Endpoint não encontrado"})
+            return
+
+        if snapshot is None:
+            self._send_json(503, {"error": "Snapshot ainda não disponível"})
+            return
+
+        if parsed.path == "/products":
+            try:
+                items = filter_products(snapshot.products, params)
+                body = paginate(items, params)
+            except ValueError as e:
+                self._send_json(400, {"error": f"Parâmetro inválido: {e}"})
+                return
+        elif parsed.path == "/stats":
+            body = {"items": list(snapshot.category_stats)}
+        else:
+            body = {"insight": snapshot.insight}
+
+        body["generated_at"] = snapshot.created_at
+        self._send_json(200, body)
+
+    def _send_json(self, status: int, body: Dict[str, Any]):
+        """
+        Serializa o corpo em JSON (UTF-8) e envia a resposta.
+        """
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Silencia o log padrão de cada requisição para não poluir o console
+        pass
+
+def create_server(service: SnapshotService, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    """
+    Cria o servidor HTTP (uma thread por requisição) ligado ao serviço de snapshots.
+    """
+    handler = type("BoundSnapshotRequestHandler", (SnapshotRequestHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+def run_service(host: str = "127.0.0.1", port: int = 8000, interval: int = 300, with_ai: bool = True):
+    """
+    Inicia o modo serviço: atualização periódica em segundo plano e API HTTP/JSON local.
+    Bloqueia até o usuário interromper com Ctrl+C.
+    """
+    service = SnapshotService(interval=interval, with_ai=with_ai)
+    service.start()
+    server = create_server(service, host, port)
+    print(f"Serviço disponível em http://{host}:{port} (atualização a cada {interval}s). Ctrl+C para encerrar.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nEncerrando serviço...")
+    finally:
+        server.server_close()
+        service.stop()
+
+if __name__ == "__main__":
+    # Bloco de teste: executa o serviço sem IA (python -m src.service)
+    run_service(with_ai=False)
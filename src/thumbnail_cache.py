@@ -0,0 +1,274 @@
+import os
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from PIL import Image
+
+class ThumbnailCache:
+    """
+    Classe responsável por baixar, reduzir e armazenar em disco as imagens dos produtos.
+    As miniaturas ficam em um cache LRU com tamanho máximo, indexado pelo hash da URL,
+    para que o dashboard não precise buscar cada imagem na rede a cada exibição.
+    """
+
+    def __init__(self, cache_dir: str = "output/thumbnails", max_bytes: int = 20 * 1024 * 1024,
+                 thumb_size: Tuple[int, int] = (256, 256), max_workers: int = 8, failure_ttl: int = 300):
+        """
+        Inicializa o cache de miniaturas.
+        Cria o diretório do cache caso ele não exista e carrega o índice LRU a partir dos arquivos já salvos.
+
+        Args:
+            cache_dir (str): Pasta onde as miniaturas são gravadas.
+            max_bytes (int): Tamanho máximo total do cache em bytes.
+            thumb_size (Tuple[int, int]): Dimensão máxima (largura, altura) das miniaturas.
+            max_workers (int): Número máximo de downloads simultâneos durante o prefetch.
+            failure_ttl (int): Tempo em segundos durante o qual uma URL que falhou não é buscada novamente.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.thumb_size = thumb_size
+        self.max_workers = max_workers
+        self.failure_ttl = failure_ttl
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        # Índice LRU: nome do arquivo -> tamanho em bytes (o mais antigo fica no início)
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        # Entradas de prefetches em andamento, que não podem ser removidas pelo limite LRU
+        self._pinned = Counter()
+        # URLs que falharam recentemente: URL -> momento da falha
+        self._failures: Dict[str, float] = {}
+        self._load_index()
+
+    def _load_index(self):
+        """
+        Reconstrói o índice LRU a partir dos arquivos em disco, ordenando pela data de último acesso (mtime).
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".jpg"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, name, stat.st_size))
+
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _filename(self, url: str) -> str:
+        """
+        Gera o nome do arquivo da miniatura a partir do hash SHA-256 da URL.
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest() + ".jpg"
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Retorna o caminho da miniatura se ela já estiver no cache, sem acessar a rede.
+        Marca a entrada como usada recentemente.
+
+        Retorna:
+            Optional[str]: Caminho do arquivo da miniatura, ou None se não estiver no cache.
+        """
+        name = self._filename(url)
+        path = os.path.join(self.cache_dir, name)
+        with self._lock:
+            if name not in self._index:
+                return None
+            self._index.move_to_end(name)
+        try:
+            # Atualiza o mtime para que a ordem LRU sobreviva a reinícios
+            os.utime(path, None)
+        except OSError:
+            # O arquivo foi removido por fora; descarta a entrada do índice
+            with self._lock:
+                size = self._index.pop(name, None)
+                if size is not None:
+                    self._total_bytes -= size
+            return None
+        return path
+
+    def fetch(self, url: str) -> Optional[str]:
+        """
+        Retorna o caminho da miniatura, baixando e reduzindo a imagem caso ela não esteja no cache.
+
+        Retorna:
+            Optional[str]: Caminho do arquivo da miniatura, ou None em caso de falha.
+        """
+        if not url:
+            return None
+
+        path = self.get(url)
+        if path:
+            return path
+
+        # Evita repetir, a cada reload do dashboard, downloads que acabaram de falhar
+        with self._lock:
+            failed_at = self._failures.get(url)
+        if failed_at is not None and time.time() - failed_at < self.failure_ttl:
+            return None
+
+        try:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+            data = self._make_thumbnail(response.content)
+        except requests.exceptions.RequestException as e:
+            print(f"Erro ao baixar imagem {url}: {e}")
+            self._record_failure(url)
+            return None
+        except (OSError, Image.DecompressionBombError) as e:
+            # Pillow lança OSError quando o conteúdo não é uma imagem válida
+            print(f"Erro ao processar imagem {url}: {e}")
+            self._record_failure(url)
+            return None
+
+        with self._lock:
+            self._failures.pop(url, None)
+        return self._store(url, data)
+
+    def _record_failure(self, url: str):
+        """
+        Registra a falha de uma URL e descarta registros já expirados.
+        """
+        now = time.time()
+        with self._lock:
+            self._failures = {u: t for u, t in self._failures.items() if now - t < self.failure_ttl}
+            self._failures[url] = now
+
+    def prefetch(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Baixa em paralelo as miniaturas das URLs informadas, limitando o número de downloads simultâneos.
+
+        Args:
+            urls (Iterable[str]): URLs das imagens dos produtos.
+
+        Retorna:
+            Dict[str, Optional[str]]: Mapeamento URL -> caminho da miniatura (None quando falhou).
+        """
+        # Remove duplicatas e valores vazios mantendo a ordem original
+        unique_urls = [u for u in dict.fromkeys(urls) if isinstance(u, str) and u]
+        if not unique_urls:
+            return {}
+
+        names = [self._filename(u) for u in unique_urls]
+        with self._lock:
+            self._pinned.update(names)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self.fetch, unique_urls))
+            # Monta o resultado só depois do pool terminar, confirmando que cada arquivo ainda existe
+            return {url: self.get(url) for url in unique_urls}
+        finally:
+            # Libera as entradas do lote; o limite volta a valer a partir do próximo armazenamento
+            with self._lock:
+                self._pinned -= Counter(names)
+
+    def _make_thumbnail(self, content: bytes) -> bytes:
+        """
+        Reduz a imagem para o tamanho de miniatura e a converte para JPEG.
+        Áreas transparentes (PNG) recebem fundo branco.
+        """
+        with Image.open(BytesIO(content)) as img:
+            img.thumbnail(self.thumb_size)
+            if img.mode in ("RGBA", "LA", "P"):
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[-1])
+                img = background
+            else:
+                img = img.convert("RGB")
+
+            buffer = BytesIO()
+            img.save(buffer, format="JPEG", quality=85)
+            return buffer.getvalue()
+
+    def _store(self, url: str, data: bytes) -> Optional[str]:
+        """
+        Grava a miniatura no disco de forma atômica e atualiza o índice LRU.
+        """
+        name = self._filename(url)
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            # os.replace é atômico: leitores nunca veem um arquivo pela metade
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Erro ao salvar miniatura: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        with self._lock:
+            previous = self._index.pop(name, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._index[name] = len(data)
+            self._total_bytes += len(data)
+            self._evict(keep=name)
+        return path
+
+    def _evict(self, keep: Optional[str] = None):
+        """
+        Remove as miniaturas menos usadas recentemente até o cache respeitar o limite de tamanho.
+        A entrada recém-gravada (keep) e as de prefetches em andamento nunca são removidas,
+        então um lote maior que o limite pode ultrapassá-lo temporariamente.
+        Deve ser chamado com o lock adquirido (ou durante a inicialização).
+        """
+        for name in list(self._index):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if name == keep or self._pinned[name]:
+                continue
+            size = self._index.pop(name)
+            self._total_bytes -= size
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+if __name__ == "__main__":
+    # Bloco de teste: sobe um servidor local de imagens para testar o cache sem depender da internet
+    import tempfile
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+
+    buffer = BytesIO()
+    Image.new("RGBA", (800, 600), (200, 30, 30, 128)).save(buffer, format="PNG")
+    sample_png = buffer.getvalue()
+
+    class ImageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(sample_png)))
+            self.end_headers()
+            self.wfile.write(sample_png)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Limite pequeno para forçar a remoção de entradas antigas
+        cache = ThumbnailCache(cache_dir=tmp_dir, max_bytes=10 * 1024, max_workers=4)
+        urls = [f"{base_url}/img/{i}.png" for i in range(10)]
+        result = cache.prefetch(urls)
+        print(f"Miniaturas geradas: {sum(1 for p in result.values() if p)} de {len(urls)}")
+        print(f"Caminhos retornados que existem em disco: {sum(1 for p in result.values() if p and os.path.exists(p))}")
+        print(f"Arquivos no cache após limite LRU: {len(os.listdir(tmp_dir))}")
+        print(f"Última imagem em cache: {cache.get(urls[-1]) is not None}")
+
+    server.shutdown()